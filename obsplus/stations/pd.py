@@ -1,6 +1,7 @@
 """
 Pandas functionality for stations stuff.
 """
+import operator
 import os
 from pathlib import Path
 
@@ -17,9 +18,20 @@ from obsplus.structures.dfextractor import (
     DataFrameExtractor,
     standard_column_transforms,
 )
-from obsplus.utils.misc import get_instances_from_tree, apply_to_files_or_skip
+from obsplus.utils.misc import get_instances_from_tree, iter_files
+from obsplus.utils.pd import pack_nslc_array
+
+# map file extensions to the obspy inventory format they must hold
+_INVENTORY_FORMATS = {".seed": "SEED", ".dataless": "SEED"}
+# extensions which usually, but not always, hold StationXML
+_STATIONXML_EXTENSIONS = {".xml", ".stationxml"}
 
 # attributes from channel to extract
+_CHANNEL_COLUMNS = STATION_COLUMNS[5:]
+_get_channel_attrs = operator.attrgetter(*_CHANNEL_COLUMNS)
+_get_waveform_id_codes = operator.attrgetter(
+    "network_code", "station_code", "location_code", "channel_code"
+)
 
 stations_to_df = DataFrameExtractor(
     Channel,
@@ -32,8 +44,11 @@ stations_to_df = DataFrameExtractor(
 @stations_to_df.extractor()
 def _extract_from_channels(channel):
     """extract info from channels."""
-    out = {x: getattr(channel, x) for x in STATION_COLUMNS[5:]}
-    return out
+    return dict(zip(_CHANNEL_COLUMNS, _get_channel_attrs(channel)))
+
+
+# an empty dataframe with the expected columns and dtypes
+_EMPTY_STATIONS_DF = stations_to_df(pd.DataFrame(columns=list(STATION_COLUMNS)))
 
 
 @stations_to_df.register(obspy.Inventory)
@@ -41,33 +56,71 @@ def _extract_channel(inventory: obspy.Inventory):
     """
     Get a summary dataframe from the stations object
     """
-    extras = {}
-    chans = []
+    # gather values directly into columns rather than making a dict per row
+    nets, stas, locs, chans, channels = [], [], [], [], []
     for net in inventory.networks:
         for sta in net.stations:
             for chan in sta.channels:
-                chan_dict = {
-                    "network": net.code,
-                    "station": sta.code,
-                    "channel": chan.code,
-                    "location": chan.location_code,
-                }
-                chan_dict["seed_id"] = ".".join((chan_dict[x] for x in NSLC))
-                extras[id(chan)] = chan_dict
-                chans.append(chan)
-    return stations_to_df(chans, extras=extras)
+                nets.append(net.code)
+                stas.append(sta.code)
+                locs.append(chan.location_code)
+                chans.append(chan.code)
+                channels.append(chan)
+    out = {"network": nets, "station": stas, "location": locs, "channel": chans}
+    attrs = zip(*map(_get_channel_attrs, channels))
+    out.update(zip(_CHANNEL_COLUMNS, attrs))
+    return stations_to_df.from_columns(out)
+
+
+def _read_inv_file(path):
+    """Return a dataframe for a readable station file, else None."""
+    try:
+        return _str_inv_to_df(path)
+    except Exception:
+        return None
 
 
 @stations_to_df.register(str)
 @stations_to_df.register(Path)
-def _str_inv_to_df(path):
-    """read stations object from file or directory structure"""
+def _str_inv_to_df(path, executor=None):
+    """
+    read stations object from file or directory structure
+
+    Parameters
+    ----------
+    path
+        A path to a station file or a directory containing station files.
+    executor
+        An executor with a map method (eg a ProcessPoolExecutor) used to
+        read the files of a directory in parallel. If None, read serially.
+    """
     path = str(path)
-    # if applied to directory, recurse
+    # if applied to directory, read each file and concat once
     if os.path.isdir(path):
-        df = pd.concat(list(apply_to_files_or_skip(_str_inv_to_df, path)))
-        df.reset_index(drop=True, inplace=True)
-        return df
+        files = iter_files(path, skip_hidden=False)
+        if executor is None:
+            outs = map(_read_inv_file, files)
+        else:
+            outs = executor.map(_read_inv_file, files, chunksize=4)
+        # empty frames can force dtype changes (and copies) when concatenating
+        frames = [x for x in outs if x is not None and not x.empty]
+        if not frames:
+            return _EMPTY_STATIONS_DF.copy()
+        return pd.concat(frames, ignore_index=True, copy=False)
+    # use the extension, if known, to avoid probing the file format
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return stations_to_df(pd.read_csv(path))
+    if ext in _INVENTORY_FORMATS:
+        inv = obspy.read_inventory(path, format=_INVENTORY_FORMATS[ext])
+        return stations_to_df(inv)
+    if ext in _STATIONXML_EXTENSIONS:
+        try:
+            inv = obspy.read_inventory(path, format="STATIONXML")
+        except Exception:  # other xml formats (eg arclink), probe below
+            pass
+        else:
+            return stations_to_df(inv)
     # else try to read single file
     try:
         return stations_to_df(obspy.read_inventory(path))
@@ -75,23 +128,55 @@ def _str_inv_to_df(path):
         return stations_to_df(pd.read_csv(path))
 
 
+def _yield_waveform_ids(obj):
+    """
+    Yield the WaveformStreamIDs attached to an event or catalog.
+
+    Only the attributes known to hold waveform ids are visited; any other
+    type falls back to recursing the whole object tree.
+    """
+    if isinstance(obj, Catalog):
+        for event in obj:
+            yield from _yield_waveform_ids(event)
+    elif isinstance(obj, Event):
+        for items in (obj.picks, obj.amplitudes, obj.station_magnitudes):
+            for item in items:
+                if item.waveform_id is not None:
+                    yield item.waveform_id
+        for fm in obj.focal_mechanisms:
+            yield from fm.waveform_id
+    else:
+        yield from get_instances_from_tree(obj, WaveformStreamID)
+
+
 @stations_to_df.register(Event)
 @stations_to_df.register(Catalog)
 def _event_to_inv_df(event):
     """
     Pull WaveformStreamIDs out of an event and put it in a dataframe.
     """
-    wids = get_instances_from_tree(event, WaveformStreamID)
-    wid_str = {x.get_seed_string() for x in wids}
-    df = pd.DataFrame(sorted(wid_str), columns=["seed_id"])
-    seed = df["seed_id"].str.split(".", expand=True)
-    df["network"], df["station"] = seed[0], seed[1]
-    df["location"], df["channel"] = seed[2], seed[3]
-    df["start_date"] = np.nan
-    df["end_date"] = np.nan
-    df["latitude"] = np.nan
-    df["longitude"] = np.nan
-    df["elevation"] = np.nan
+    # collect the raw codes of each unique id rather than calling
+    # get_seed_string on every waveform id, then fill in missing codes.
+    codes = set(map(_get_waveform_id_codes, _yield_waveform_ids(event)))
+    seeds = sorted({tuple(x or "" for x in code) for code in codes})
+    if not seeds:  # no waveform ids (e.g. empty catalog or no picks)
+        return _EMPTY_STATIONS_DF.copy()
+    wid_str = list(map(".".join, seeds))
+    seed = np.array(seeds, dtype=object).reshape(-1, 4)
+    df = pd.DataFrame(
+        {
+            "network": seed[:, 0],
+            "station": seed[:, 1],
+            "location": seed[:, 2],
+            "channel": seed[:, 3],
+            "seed_id": wid_str,
+            "start_date": np.datetime64("NaT"),
+            "end_date": np.datetime64("NaT"),
+            "latitude": np.nan,
+            "longitude": np.nan,
+            "elevation": np.nan,
+        }
+    )
     return stations_to_df(df)
 
 
@@ -117,13 +202,15 @@ def _stream_to_station_df(st):
     for tr in st:
         stats_summary.append({at: getattr(tr.stats, at, None) for at in attrs})
     df = pd.DataFrame(stats_summary)
-    # next groupby stations and get min/max for start_date and end_date
-    group = df.groupby(list(NSLC))
-    df = (
-        pd.concat([group["starttime"].min(), group["endtime"].max()], axis=1)
-        .reset_index()
-        .rename(columns={"starttime": "start_date", "endtime": "end_date"})
-    )
+    # next groupby stations and get min/max for start_date and end_date,
+    # use packed nslc codes as the group key when possible.
+    try:
+        key = pack_nslc_array(*(df[x].values for x in NSLC))
+    except ValueError:  # codes which cant be packed, group on strs
+        key = [df[x] for x in NSLC]
+    aggs = {x: (x, "first") for x in NSLC}
+    aggs.update(start_date=("starttime", "min"), end_date=("endtime", "max"))
+    df = df.groupby(key).agg(**aggs).reset_index(drop=True)
     return stations_to_df(df)
 
 
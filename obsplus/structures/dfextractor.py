@@ -2,11 +2,16 @@
 DataFrameExtractor class and friends.
 """
 import copy
+import os
 import warnings
-from collections import UserDict
+import weakref
+from collections import OrderedDict, UserDict
+from collections.abc import Sized
 from functools import singledispatch, reduce
+from pathlib import Path
 from typing import Mapping, Sequence, Optional, Dict
 
+import numpy as np
 import pandas as pd
 
 from obsplus.constants import column_function_map_type, TIME_COLUMNS, NSLC
@@ -46,6 +51,37 @@ def _get_output_dict(obj, name, func):
         return {name: out}
 
 
+def _get_float_dtype(dtype) -> Optional[np.dtype]:
+    """Return a numpy dtype if dtype is a float type, else None."""
+    if dtype is None:
+        return None
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:  # custom obsplus dtype
+        return None
+    return dtype if np.issubdtype(dtype, np.floating) else None
+
+
+def _get_cache_key(obj):
+    """
+    Return a key identifying obj's current state and a weakref to obj.
+
+    Returns (None, None) if obj should not be cached.
+    """
+    if isinstance(obj, (str, Path)):
+        path = str(obj)
+        if not os.path.isfile(path):
+            return None, None
+        stat = os.stat(path)
+        return ("path", path, stat.st_mtime_ns, stat.st_size), None
+    try:
+        ref = weakref.ref(obj)
+    except TypeError:  # object doesn't support weak references
+        return None, None
+    size = len(obj) if isinstance(obj, Sized) else None
+    return ("id", id(obj), size), ref
+
+
 class DataFrameExtractor(UserDict):
     """
     A class to extract dataframes from nested object trees.
@@ -73,6 +109,7 @@ class DataFrameExtractor(UserDict):
 
     nslc = set(NSLC)
     nslc.add("seed_id")
+    _cache_size = 8
 
     def __init__(
         self,
@@ -88,6 +125,7 @@ class DataFrameExtractor(UserDict):
         self._base_required_columns = required_columns
         self._dtypes = [dtypes] if dtypes is not None else []
         self._column_funcs = column_funcs or ()
+        self._cache = OrderedDict()
         if pass_dataframe:
             self._func.register(pd.DataFrame)(_pass_through_dataframe)
 
@@ -184,6 +222,65 @@ class DataFrameExtractor(UserDict):
 
         return pd.DataFrame(rows)
 
+    def from_columns(self, columns: Mapping[str, Sequence]) -> pd.DataFrame:
+        """
+        Create a dataframe from a mapping of {column name: values}.
+
+        This allows registered constructors to gather values by column rather
+        than creating a dict for each row. Columns with a float dtype are
+        converted to arrays of that type up front (None becomes NaN); the
+        others are left to the usual post-processing done in __call__.
+
+        Parameters
+        ----------
+        columns
+            A mapping of column names to sequences of equal length.
+        """
+        dtypes = self.dtypes
+        out = {}
+        for name, values in columns.items():
+            dtype = _get_float_dtype(dtypes.get(name))
+            out[name] = values if dtype is None else np.asarray(values, dtype=dtype)
+        return pd.DataFrame(out)
+
+    def cached(self, obj, **kwargs) -> pd.DataFrame:
+        """
+        Call the extractor, re-using the output of previous calls on obj.
+
+        In-memory objects are identified by their id and length, paths to
+        files by their modification time and size. Objects which cannot be
+        identified this way (e.g. directories), and calls with unhashable
+        kwargs, are not cached. A copy of the cached dataframe is returned
+        so changes to it do not leak back.
+
+        Parameters
+        ----------
+        obj
+            The object to recurse.
+
+        Notes
+        -----
+        In-place changes to an object which do not change its length (e.g.
+        ``inv[0][0][0].latitude = 1.0``) are not detected, so stale data is
+        returned. Call the extractor directly after modifying objects.
+        """
+        key, ref = _get_cache_key(obj)
+        if key is None:
+            return self(obj, **kwargs)
+        key = (key, tuple(sorted(kwargs.items())))
+        try:
+            entry = self._cache.get(key)
+        except TypeError:  # unhashable kwargs, can't be cached
+            return self(obj, **kwargs)
+        if entry is not None and (entry[0] is None or entry[0]() is obj):
+            self._cache.move_to_end(key)
+            return entry[1].copy()
+        df = self(obj, **kwargs)
+        self._cache[key] = (ref, df)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return df.copy()
+
     def copy(self) -> "DataFrameExtractor":
         """Return a deep copy of the fetcher."""
         return copy.deepcopy(self)
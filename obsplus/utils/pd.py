@@ -312,6 +312,81 @@ def get_seed_id_series(
     return join_str_columns(nslc, columns=cols, join_char=".")
 
 
+# The max number of characters in each nslc code (as defined by SEED)
+_NSLC_WIDTHS = (2, 5, 2, 3)
+# map ascii bytes to base 37 digits; space is only used for padding (so
+# codes with spaces are rejected), -1 is not allowed.
+_NSLC_CHARS = b" 0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_NSLC_DIGITS = np.full(256, -1, dtype=np.int64)
+_NSLC_DIGITS[np.frombuffer(_NSLC_CHARS, dtype=np.uint8)] = np.arange(len(_NSLC_CHARS))
+
+
+def pack_nslc_array(network, station, location, channel) -> np.ndarray:
+    """
+    Pack arrays of nslc codes into an array of int64.
+
+    Each code is padded to its SEED width (2, 5, 2, 3) and the resulting 12
+    characters are encoded as a base 37 number, which fits in an int64.
+    Packed values are unique for each nslc and sort in the same order as
+    the codes, which makes them cheap keys for grouping and matching.
+
+    Parameters
+    ----------
+    network
+        A sequence of network codes.
+    station
+        A sequence of station codes.
+    location
+        A sequence of location codes.
+    channel
+        A sequence of channel codes.
+
+    Raises
+    ------
+    ValueError
+        If any code is too long or uses characters other than upper case
+        letters and digits (including spaces, which are used for padding).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> packed = pack_nslc_array(["UU", "UU"], ["TMU", "NOQ"], ["01", ""], ["HHZ"] * 2)
+    >>> assert packed.dtype == np.int64
+    >>> assert packed[0] != packed[1]
+    """
+    codes = []
+    for values, width in zip((network, station, location, channel), _NSLC_WIDTHS):
+        values = np.asarray(values, dtype=str)
+        if np.any(np.char.str_len(values) > width):
+            msg = f"nslc codes must be no more than {width} characters"
+            raise ValueError(msg)
+        # spaces would be indistinguishable from the padding
+        if np.any(np.char.count(values, " ")):
+            raise ValueError("nslc codes must not contain spaces")
+        codes.append(np.char.ljust(values, width))
+    joined = reduce(np.char.add, codes)
+    try:
+        encoded = np.char.encode(joined, "ascii").astype("S12")
+    except UnicodeEncodeError:
+        raise ValueError("nslc codes must be ascii")
+    digits = _NSLC_DIGITS[encoded.view(np.uint8).reshape(-1, 12)]
+    if np.any(digits < 0):
+        raise ValueError("nslc codes must only use upper case letters and digits")
+    out = np.zeros(len(digits), dtype=np.int64)
+    for column in digits.T:
+        out = out * 37 + column
+    return out
+
+
+def pack_nslc(network: str, station: str, location: str, channel: str) -> np.int64:
+    """
+    Pack a single set of nslc codes into an int64.
+
+    See :func:`~obsplus.utils.pd.pack_nslc_array` for details.
+    """
+    return pack_nslc_array([network], [station], [location], [channel])[0]
+
+
 def filter_index(
     index: pd.DataFrame,
     network: Optional = None,
@@ -4,14 +4,16 @@ Stream utilities
 import copy
 
 import warnings
+from collections import defaultdict
 from functools import singledispatch
 from pathlib import Path
-from typing import Optional, Union, List, Any
+from typing import Optional, Union, List, Any, Sequence
 
 import numpy as np
 import obspy
 import pandas as pd
 from obspy import Stream, UTCDateTime
+from pandas.api.types import is_datetime64_dtype
 
 import obsplus
 from obsplus.constants import (
@@ -31,6 +33,19 @@ from obsplus.utils.pd import get_seed_id_series, cast_dtypes, _column_contains
 from obsplus.utils.time import to_utc, to_timedelta64, to_datetime64
 from obsplus.utils.misc import ObjectWrapper
 
+# characters used for unix style matching of nslc codes
+_MATCH_CHARS = frozenset("*?[]")
+
+# columns of bulk request dataframes, the ones holding times, and the others
+_BULK_COLUMN_ORDER = list(WAVEFORM_REQUEST_DTYPES)
+_BULK_REQUIRED_COLUMNS = frozenset(WAVEFORM_REQUEST_DTYPES)
+_BULK_TIME_COLUMNS = tuple(
+    i for i, v in WAVEFORM_REQUEST_DTYPES.items() if v == "ops_datetime"
+)
+_BULK_OTHER_DTYPES = {
+    i: v for i, v in WAVEFORM_REQUEST_DTYPES.items() if i not in _BULK_TIME_COLUMNS
+}
+
 
 # ---------- trim functions
 
@@ -74,29 +89,32 @@ def trim_event_stream(
     if merge is not None:  # merge
         stream.merge(method=merge)
         stream = stream.split()
-    # get a dataframe of start/end/duration and trace
-    data = [
-        (tr.stats.starttime.timestamp, tr.stats.endtime.timestamp, tr) for tr in stream
-    ]
-    df = pd.DataFrame(data, columns=["start", "end", "trace"])
-    df["duration"] = df.end - df.start
+    # get arrays of start/end timestamps (in seconds) for each trace
+    count = len(stream)
+    starts = np.fromiter((tr.stats.starttime._ns for tr in stream), np.int64, count)
+    ends = np.fromiter((tr.stats.endtime._ns for tr in stream), np.int64, count)
+    starts, ends = starts / 1e9, ends / 1e9
     # get start and end times
-    stream = _trim_stream(df, stream, required_len, trim_tolerance)
+    stream = _trim_stream(stream, starts, ends, required_len, trim_tolerance)
     # ensure each channel has exactly one trace or merge to create masked
     if not len(stream) == len({tr.id for tr in stream}):
         stream.merge(method=merge)
     return stream
 
 
-def _trim_stream(df, stream, required_len, trim_tolerance):
+def _trim_stream(stream, starts, ends, required_len, trim_tolerance):
     """
     Get the starttimes and endtimes for trimming, raise ValueError
     if the stream is disjointed.
+
+    Starts and ends are arrays of timestamps for each trace in stream.
     """
+    if not len(starts):
+        return Stream()
     # check trim tolerance
     if trim_tolerance is not None:
-        con1 = (df.start.max() - df.start.min()) > trim_tolerance
-        con2 = (df.end.max() - df.start.min()) > trim_tolerance
+        con1 = (starts.max() - starts.min()) > trim_tolerance
+        con2 = (ends.max() - starts.min()) > trim_tolerance
         if con1 or con2:
             msg = (
                 "the following waveforms did not meed the required trim "
@@ -105,18 +123,20 @@ def _trim_stream(df, stream, required_len, trim_tolerance):
             raise ValueError(msg)
     # check length requirements, pop out any traces that dont meet it
     if required_len is not None:
-        req_len = np.round(required_len * df.duration.max(), 2)
-        too_short = df.duration <= req_len
+        durations = ends - starts
+        req_len = np.round(required_len * durations.max(), 2)
+        too_short = durations <= req_len
         if too_short.any():
-            trace_str = "\n".join([str(x) for x in df[too_short].trace])
+            short = [tr for tr, bad in zip(stream, too_short) if bad]
+            trace_str = "\n".join([str(x) for x in short])
             msg = f"These traces are not at least {req_len} seconds long:\n"
             warnings.warn(msg + trace_str + "\n removing them", UserWarning)
-            stream.traces = list(df[~too_short].trace)
-        df = df[~too_short]
-    if not len(df):
+            stream.traces = [tr for tr, bad in zip(stream, too_short) if not bad]
+        starts, ends = starts[~too_short], ends[~too_short]
+    if not len(starts):
         return Stream()
     # get trim time, trim, emit warnings
-    t1, t2 = to_utc(df.start.max()), to_utc(df.end.min())
+    t1, t2 = to_utc(starts.max()), to_utc(ends.min())
     if t2 < t1:
         msg = f"The following waveforms has traces with no overlaps {stream}"
         raise ValueError(msg)
@@ -137,12 +157,13 @@ def _get_waveform_df(stream: wave_type) -> pd.DataFrame:
     This is private because it is probably not quite polished enough to include
     in the public API. More thought is needed how to do this properly.
     """
-    stats_columns = list(NSLC) + ["starttime", "endtime", "sampling_rate"]
-    trace_contents = [{i: tr.stats[i] for i in stats_columns} for tr in stream]
-    df = pd.DataFrame(trace_contents, columns=stats_columns)
-    # ensure time(y) columns have proper
-    df["starttime"] = to_datetime64(df["starttime"])
-    df["endtime"] = to_datetime64(df["endtime"])
+    stats = [tr.stats for tr in stream]
+    df = pd.DataFrame({x: [stat[x] for stat in stats] for x in NSLC})
+    # build time columns directly from the ns ints of each UTCDateTime
+    for col in ["starttime", "endtime"]:
+        ns = np.array([stat[col]._ns for stat in stats], dtype=np.int64)
+        df[col] = ns.view("datetime64[ns]")
+    df["sampling_rate"] = np.array([x.sampling_rate for x in stats], dtype=float)
     df["sampling_period"] = to_timedelta64(1 / df["sampling_rate"])
     df["seed_id"] = get_seed_id_series(df)
     df["trace"] = [ObjectWrapper(tr) for tr in stream]
@@ -190,16 +211,30 @@ def stream_bulk_split(
     if not bulk or len(st) == 0:
         return []
 
-    # # get dataframe of stream contents
-    sdf = _get_waveform_df(st)
+    # index traces by seed_id so plain requests dont scan the whole stream
+    trace_dict = defaultdict(list)
+    for tr in st:
+        stats = tr.stats
+        trace_dict[tr.id].append((tr, stats.starttime._ns, stats.endtime._ns))
+    sdf = None  # dataframe of stream contents, only needed for wildcards
     # iterate stream, return output
     out = []
     for barg in bulk:
         assert len(barg) == 6, f"{barg} is not a valid bulk arg, must have len 6"
-        need = filter_index(sdf, *barg)
-        traces = [tr for tr, bo in zip(st, need) if bo]
-        new_st = obspy.Stream(traces)
         t1, t2 = to_utc(barg[-2]), to_utc(barg[-1])
+        nslc = tuple(barg)[:4]
+        if _is_plain_nslc(nslc):
+            t1_ns, t2_ns = t1._ns, t2._ns
+            traces = [
+                tr
+                for tr, start, end in trace_dict.get(".".join(nslc), ())
+                if not (end < t1_ns or start > t2_ns)
+            ]
+        else:
+            sdf = _get_waveform_df(st) if sdf is None else sdf
+            need = filter_index(sdf, *barg)
+            traces = [tr for tr, bo in zip(st, need) if bo]
+        new_st = obspy.Stream(traces)
         new = new_st.slice(starttime=t1, endtime=t2)
         # apply fill if needed
         if fill_value is not None:
@@ -213,6 +248,11 @@ def stream_bulk_split(
     return out
 
 
+def _is_plain_nslc(nslc) -> bool:
+    """Return True if the nslc codes are strs which dont use matching chars."""
+    return all(isinstance(x, str) and not (set(x) & _MATCH_CHARS) for x in nslc)
+
+
 def merge_traces(st: trace_sequence, inplace=False) -> obspy.Stream:
     """
     An efficient function to merge overlapping data for a stream.
@@ -267,23 +307,38 @@ def merge_traces(st: trace_sequence, inplace=False) -> obspy.Stream:
     for gnum in gnum_gt_one:  # any groups w/ more than one trace
         ind = df.merge_group == gnum
         gtraces = [x.data for x in df.trace[ind]]  # unpack traces
-        dtype = _get_dtype(gtraces)
-        # create list of time, y values, and marker for when values are filled
-        sampling_period = sampling_periods[gnum].to_timedelta64()
-        start, stop = t1[gnum].to_datetime64(), t2[gnum].to_datetime64()
-        t = np.arange(start=start, stop=stop + sampling_period, step=sampling_period)
-        y = np.empty(np.shape(t), dtype=dtype)
-        has_filled = np.zeros(len(t), dtype=np.int32)
-        for tr in gtraces:
-            start_ind = np.searchsorted(t, to_datetime64(tr.stats.starttime))
-            y[start_ind : start_ind + len(tr.data)] = tr.data
-            has_filled[start_ind : start_ind + len(tr.data)] = 1
-        gtraces[0].data = y
-        merged_traces.append(gtraces[0])
-        assert np.all(has_filled), "some values not filled in!"
+        start, stop = t1[gnum].value, t2[gnum].value
+        merged = _merge_group(gtraces, start, stop, sampling_periods[gnum].value)
+        merged_traces.append(merged)
     return obspy.Stream(traces=merged_traces)
 
 
+def _merge_group(traces, start: int, stop: int, period: int) -> obspy.Trace:
+    """
+    Merge a group of overlapping traces into the first trace.
+
+    Start, stop, and period are all given in ns. Sample indices are computed
+    from the offset to the group start rather than searching an array of
+    sample times, which avoids allocating a time array as long as the output.
+    """
+    dtype = _get_dtype(traces)
+    # create y values and marker for when values are filled
+    y = np.empty(_ceil_div(stop - start, period) + 1, dtype=dtype)
+    has_filled = np.zeros(len(y), dtype=bool)
+    for tr in traces:
+        start_ind = _ceil_div(tr.stats.starttime._ns - start, period)
+        y[start_ind : start_ind + len(tr.data)] = tr.data
+        has_filled[start_ind : start_ind + len(tr.data)] = True
+    assert np.all(has_filled), "some values not filled in!"
+    traces[0].data = y
+    return traces[0]
+
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    """Integer division which rounds up."""
+    return -(-numerator // denominator)
+
+
 def _get_dtype(trace_list: List[trace_sequence]) -> np.dtype:
     """
     Return the datatype that should be used for the merged trace list.
@@ -539,25 +594,53 @@ def get_waveform_bulk_df(
     -------
     A dataframe with waveform bulk columns.
     """
-    df = pd.DataFrame(bulk, columns=list(WAVEFORM_REQUEST_DTYPES))
+    columns = list(WAVEFORM_REQUEST_DTYPES)
+    # iterators (eg generators) can only be consumed once
+    if not isinstance(bulk, (Sequence, np.ndarray)):
+        bulk = list(bulk)
+    # transpose tuples of requests so the dataframe is built from columns,
+    # anything else (eg dicts) is left to the dataframe constructor.
+    is_rows = len(bulk) and all(
+        isinstance(x, (tuple, list)) and len(x) == len(columns) for x in bulk
+    )
+    if is_rows:
+        df = pd.DataFrame(dict(zip(columns, zip(*bulk))))
+    else:
+        df = pd.DataFrame(bulk, columns=columns)
     return _df_to_waveform_bulk(df)
 
 
 @get_waveform_bulk_df.register(pd.DataFrame)
 def _df_to_waveform_bulk(df):
     """Ensure the dataframe has appropriate columns and return."""
-    current_columns = set(df.columns)
-    required_columns = list(WAVEFORM_REQUEST_DTYPES)
     # ensure columns exist
-    if not current_columns.issuperset(required_columns):
-        missing = set(required_columns) - set(current_columns)
+    missing = _BULK_REQUIRED_COLUMNS.difference(df.columns)
+    if missing:
         msg = (
             f"Dataframe is missing the following columns to be valid input"
-            f" for bulk waveform request {missing}"
+            f" for bulk waveform request {set(missing)}"
         )
         raise ValidationError(msg)
-    out = df[list(required_columns)]
-    return cast_dtypes(out, dtype=WAVEFORM_REQUEST_DTYPES)[required_columns]
+    # select (and order) required columns, drop any others
+    out = df.loc[:, _BULK_COLUMN_ORDER]
+    # convert time columns here, cast_dtypes would convert them element-wise
+    times = {x: _bulk_times_to_datetime64(out[x]) for x in _BULK_TIME_COLUMNS}
+    return cast_dtypes(out.assign(**times), dtype=_BULK_OTHER_DTYPES)
+
+
+def _bulk_times_to_datetime64(ser: pd.Series) -> pd.Series:
+    """
+    Convert a column of bulk request times to datetime64[ns].
+
+    Datetime columns are simply cast and columns of only UTCDateTimes are
+    converted from their ns ints; anything else uses to_datetime64.
+    """
+    if is_datetime64_dtype(ser):
+        return ser.astype("datetime64[ns]")
+    if all(isinstance(x, UTCDateTime) for x in ser.values):
+        ns = np.fromiter((x._ns for x in ser.values), np.int64, len(ser))
+        return pd.Series(ns.view("datetime64[ns]"), index=ser.index)
+    return to_datetime64(ser)
 
 
 def _filter_index_to_bulk(time, index_df, bulk_df) -> pd.DataFrame:
@@ -7,13 +7,18 @@ from pathlib import Path
 
 import numpy as np
 import obspy
+import obspy.core.event as ev
 import pandas as pd
 import pytest
 
 import obsplus
 from obsplus import stations_to_df
 from obsplus.constants import STATION_COLUMNS, pd_time_types
-from obsplus.utils.misc import register_func, suppress_warnings
+from obsplus.utils.misc import (
+    register_func,
+    suppress_warnings,
+    get_instances_from_tree,
+)
 
 STA_COLUMNS = {"latitude", "longitude", "elevation", "start_date", "end_date"}
 
@@ -55,6 +60,19 @@ class TestInv2Df:
         assert isinstance(df, pd.DataFrame)
         assert len(chans) == len(df)
 
+    def test_seed_id_matches_nslc(self, invdf):
+        """ensure seed_id is built from the nslc columns and order is kept."""
+        assert list(invdf.columns[: len(STATION_COLUMNS)]) == list(STATION_COLUMNS)
+        nslc = invdf[["network", "station", "location", "channel"]]
+        expected = nslc.apply(".".join, axis=1)
+        assert (invdf["seed_id"] == expected).all()
+
+    def test_empty_inventory(self):
+        """an empty inventory should return an empty dataframe."""
+        df = stations_to_df(obspy.Inventory())
+        assert df.empty
+        assert set(STATION_COLUMNS).issubset(df.columns)
+
     def test_time_columns(self, invdf):
         """ensure the times are np.datetime instances."""
         assert invdf["start_date"].dt  # if not dt this will raise
@@ -229,6 +247,75 @@ class TestReadDirectoryOfInventories:
         assert len(inv_df) == len(read_inventory)
         assert set(inv_df["seed_id"]) == set(read_inventory["seed_id"])
 
+    def test_empty_and_unreadable_files(self, tmp_path):
+        """Empty inventories and junk files should not add columns or rows."""
+        inv = obspy.read_inventory()
+        inv.write(str(tmp_path / "inv.xml"), "stationxml")
+        empty = obspy.Inventory(networks=[obspy.core.inventory.Network("XX")])
+        empty.write(str(tmp_path / "empty.xml"), "stationxml")
+        with (tmp_path / "junk.txt").open("w") as fi:
+            fi.write("not_a_column")
+        df = stations_to_df(tmp_path)
+        assert list(df.columns) == list(STATION_COLUMNS)
+        assert len(df) == len(stations_to_df(inv))
+
+    def test_empty_directory(self, tmp_path):
+        """An empty directory should return an empty dataframe."""
+        df = stations_to_df(tmp_path)
+        assert df.empty
+        assert list(df.columns) == list(STATION_COLUMNS)
+
+    def test_read_with_executor(self, inv_directory, read_inventory, executor):
+        """Reading with an executor should give the same dataframe."""
+        with suppress_warnings():
+            df = stations_to_df(inv_directory, executor=executor)
+        assert df.equals(read_inventory)
+
+
+class TestReadInventoryFileFormats:
+    """Ensure files are read according to their extension and contents."""
+
+    arclink_path = (
+        Path(obspy.__file__).parent
+        / "io"
+        / "arclink"
+        / "tests"
+        / "data"
+        / "arclink_inventory.xml"
+    )
+
+    @pytest.fixture
+    def arclink_xml(self, tmp_path):
+        """Copy an arclink inventory (which isn't StationXML) to a temp dir."""
+        if not self.arclink_path.exists():
+            pytest.skip("obspy test data not installed")
+        path = tmp_path / "inv.xml"
+        path.write_bytes(self.arclink_path.read_bytes())
+        return path
+
+    @pytest.mark.parametrize("ext", [".xml", ".stationxml", ".csv"])
+    def test_extensions(self, tmp_path, ext):
+        """Files with known extensions should be read."""
+        inv = obspy.read_inventory()
+        expected = stations_to_df(inv)
+        path = tmp_path / f"inv{ext}"
+        if ext == ".csv":
+            expected.to_csv(path, index=False)
+        else:
+            inv.write(str(path), "stationxml")
+        df = stations_to_df(path)
+        assert len(df) == len(expected)
+        assert set(df["seed_id"]) == set(expected["seed_id"])
+
+    def test_non_stationxml_xml(self, arclink_xml):
+        """Other xml inventory formats should still be detected."""
+        expected = stations_to_df(obspy.read_inventory(str(self.arclink_path)))
+        df = stations_to_df(arclink_xml)
+        assert len(df) == len(expected)
+        assert set(df["seed_id"]) == set(expected["seed_id"])
+        # and the file shouldn't be skipped when reading a directory
+        assert len(stations_to_df(arclink_xml.parent)) == len(expected)
+
 
 class TestReadTAInventory:
     """read the ta_test inventories (csv and xml) and run tests"""
@@ -330,6 +417,37 @@ class TestStationDfFromCatalog:
         assert isinstance(df, pd.DataFrame)
         assert not df.empty
 
+    def test_matches_tree_search(self, bingham_dataset):
+        """All waveform ids found by recursing the catalog should be used."""
+        cat = bingham_dataset.event_client.get_events()
+        wids = get_instances_from_tree(cat, ev.WaveformStreamID)
+        expected = {x.get_seed_string() for x in wids}
+        df = stations_to_df(cat)
+        assert set(df["seed_id"]) == expected
+
+    def test_focal_mechanism_waveform_ids(self):
+        """Waveform ids on focal mechanisms should also be found."""
+        event = obspy.read_events()[0].copy()
+        wid = ev.WaveformStreamID("UU", "TMU", "01", "HHZ")
+        event.focal_mechanisms.append(ev.FocalMechanism(waveform_id=[wid]))
+        df = stations_to_df(event)
+        assert "UU.TMU.01.HHZ" in set(df["seed_id"])
+
+    def test_empty_catalog(self):
+        """An empty catalog should return independent empty dataframes."""
+        df1 = stations_to_df(obspy.Catalog())
+        assert df1.empty
+        assert list(df1.columns) == list(STATION_COLUMNS)
+        df1["bob"] = 1
+        assert "bob" not in stations_to_df(obspy.Catalog()).columns
+
+    def test_catalog_no_picks(self):
+        """A catalog without any waveform ids should return an empty df."""
+        df = stations_to_df(obspy.read_events())
+        assert isinstance(df, pd.DataFrame)
+        assert df.empty
+        assert set(STATION_COLUMNS).issubset(df.columns)
+
 
 class TestStationDfFromWaveBank:
     """Test that stations info can be extracted from the wavebank."""
@@ -354,3 +472,12 @@ class TestStationDfFromStream:
         df = obsplus.stations_to_df(st)
         assert isinstance(df, pd.DataFrame)
         assert len(df) == len(st)
+
+    def test_blank_location_codes_not_merged(self):
+        """Location codes of "" and "  " are different channels."""
+        st = obspy.read()
+        st[1].stats.location = "  "
+        st[1].stats.channel = "EHZ"
+        df = obsplus.stations_to_df(st)
+        assert len(df) == len(st)
+        assert set(df["location"]) == {"", "  "}
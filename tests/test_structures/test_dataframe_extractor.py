@@ -1,9 +1,12 @@
 """
 Tests for the dataframe extractor.
 """
+import numpy as np
+import obspy
 import obspy.core.event as ev
+import pytest
 
-from obsplus import load_dataset
+from obsplus import load_dataset, stations_to_df
 from obsplus.structures.dfextractor import DataFrameExtractor
 
 
@@ -50,3 +53,110 @@ def _get_station_count(obj):
 # get events and list of magnitudes
 cat = load_dataset("bingham_test").event_client.get_events()
 magnitudes = [mag for event in cat for mag in event.magnitudes]
+
+
+class TestFromColumns:
+    """Tests for creating dataframes from columns."""
+
+    dtypes = {"time": "ops_datetime", "value": float, "count": int}
+
+    @pytest.fixture
+    def extractor(self):
+        """Return an extractor with float, builtin and custom dtypes."""
+        return DataFrameExtractor(ev.Pick, dtypes=self.dtypes)
+
+    def test_float_columns(self, extractor):
+        """Float columns should be cast, with None becoming NaN."""
+        df = extractor.from_columns({"value": [1, None]})
+        assert df["value"].dtype == np.float64
+        assert np.isnan(df["value"].iloc[1])
+
+    def test_non_float_columns_pass_through(self, extractor):
+        """Custom and non-float dtypes are left for __call__ to cast."""
+        times = ["2020-01-01", "2020-01-02"]
+        columns = {"time": times, "count": [1, 2], "other": ["a", "b"]}
+        df = extractor.from_columns(columns)
+        assert df["time"].dtype == object
+        assert list(df["time"]) == times
+        assert list(df["count"]) == [1, 2]
+        assert list(df["other"]) == ["a", "b"]
+
+
+class TestCached:
+    """Tests for memoizing extractor calls."""
+
+    @pytest.fixture
+    def extractor(self):
+        """Return a copy of the magnitude extractor with a small cache."""
+        extractor = ml_to_df.copy()
+        extractor._cache.clear()
+        extractor._cache_size = 2
+        return extractor
+
+    def test_repeated_calls(self):
+        """Cached calls should return equal, but independent, dataframes."""
+        inv = obspy.read_inventory()
+        df1 = stations_to_df.cached(inv)
+        df2 = stations_to_df.cached(inv)
+        assert df1 is not df2
+        assert df1.equals(df2)
+        assert df1.equals(stations_to_df(inv))
+        # changing the output should not change the cached value
+        df1["station"] = "BOB"
+        assert (stations_to_df.cached(inv)["station"] != "BOB").all()
+
+    def test_inventory_changed(self):
+        """Adding networks should invalidate the cache."""
+        inv = obspy.read_inventory().select(network="GR")
+        df1 = stations_to_df.cached(inv)
+        inv += obspy.read_inventory().select(network="BW")
+        df2 = stations_to_df.cached(inv)
+        assert len(df2) > len(df1)
+        assert set(df2["network"]) == {"GR", "BW"}
+
+    def test_file_changed(self, tmp_path):
+        """Re-writing a file should invalidate the cache."""
+        path = tmp_path / "inv.xml"
+        inv = obspy.read_inventory()
+        inv.select(network="GR").write(str(path), "stationxml")
+        df1 = stations_to_df.cached(path)
+        assert set(df1["network"]) == {"GR"}
+        inv.write(str(path), "stationxml")
+        df2 = stations_to_df.cached(path)
+        assert df2.equals(stations_to_df(path))
+
+    def test_lru_eviction(self, extractor):
+        """The least recently used entry should be dropped when full."""
+        mags = [ev.Magnitude(mag=i, magnitude_type="ML") for i in range(3)]
+        extractor.cached(mags[0])
+        extractor.cached(mags[1])
+        extractor.cached(mags[0])  # mags[1] is now the least recently used
+        extractor.cached(mags[2])
+        assert len(extractor._cache) == 2
+        cached_ids = {key[0][1] for key in extractor._cache}
+        assert cached_ids == {id(mags[0]), id(mags[2])}
+
+    def test_directory_not_cached(self, tmp_path):
+        """Directories can't be identified by their state so are not cached."""
+        extractor = stations_to_df.copy()
+        extractor._cache.clear()
+        obspy.read_inventory().write(str(tmp_path / "inv.xml"), "stationxml")
+        df = extractor.cached(tmp_path)
+        assert df.equals(stations_to_df(tmp_path))
+        assert not extractor._cache
+
+    def test_no_weakref_not_cached(self, extractor):
+        """Objects which don't support weak references are not cached."""
+        mags = [ev.Magnitude(mag=i, magnitude_type="ML") for i in range(3)]
+        df = extractor.cached(mags)
+        assert len(df) == len(mags)
+        assert not extractor._cache
+
+    def test_unhashable_kwargs_not_cached(self, extractor):
+        """Calls with unhashable kwargs should fall back to the extractor."""
+        mag = ev.Magnitude(mag=1, magnitude_type="ML")
+        extras = {id(mag): {"event_id": "bob"}}
+        df = extractor.cached(mag, extras=extras)
+        assert df.equals(extractor(mag, extras=extras))
+        assert (df["event_id"] == "bob").all()
+        assert not extractor._cache
@@ -225,6 +225,39 @@ class TestGetSeedIdSeries:
             upd.get_seed_id_series(pick_df, subset=["network"])
 
 
+class TestPackNSLC:
+    """Tests for packing nslc codes into ints."""
+
+    def test_unique_and_sorted(self, waveform_df):
+        """Packed values should be unique and sort like the codes."""
+        df = pd.concat([waveform_df, waveform_df.assign(station="AB1")])
+        df = df.sort_values(list(NSLC)).drop_duplicates(list(NSLC))
+        packed = upd.pack_nslc_array(*(df[x].values for x in NSLC))
+        assert packed.dtype == np.int64
+        assert len(np.unique(packed)) == len(df)
+        assert np.all(np.diff(packed) > 0)
+
+    def test_scalar_matches_array(self, waveform_df):
+        """pack_nslc should give the same value as the array version."""
+        packed = upd.pack_nslc_array(*(waveform_df[x].values for x in NSLC))
+        for (_, row), expected in zip(waveform_df.iterrows(), packed):
+            assert upd.pack_nslc(*row[list(NSLC)]) == expected
+
+    @pytest.mark.parametrize(
+        "nslc",
+        [("UUU", "TMU", "", "HHZ"), ("uu", "TMU", "", "HHZ"), ("UU", "T*", "", "HHZ")],
+    )
+    def test_bad_codes_raise(self, nslc):
+        """Codes which are too long or have odd characters should raise."""
+        with pytest.raises(ValueError):
+            upd.pack_nslc(*nslc)
+
+    def test_spaces_raise(self):
+        """Spaces are padding so codes using them can't be packed uniquely."""
+        with pytest.raises(ValueError):
+            upd.pack_nslc_array(["UU", "UU"], ["A", "A"], ["", "  "], ["HHZ"] * 2)
+
+
 class TestMisc:
     """Misc. small tests."""
 
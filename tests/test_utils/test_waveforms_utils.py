@@ -1,8 +1,6 @@
 """
 Tests for waveform utilities.
 """
-import copy
-
 import inspect
 from pathlib import Path
 
@@ -249,10 +247,8 @@ class TestStream2Contiguous:
         for tr1, tr2 in zip(st1.traces, st2.traces):
             if not np.array_equal(tr1.data, tr2.data):
                 return False
-            d1 = copy.deepcopy(tr1.stats)
-            d1.pop("processing", None)
-            d2 = copy.deepcopy(tr2.stats)
-            d2.pop("processing", None)
+            d1 = {i: v for i, v in tr1.stats.items() if i != "processing"}
+            d2 = {i: v for i, v in tr2.stats.items() if i != "processing"}
             if not d1 == d2:
                 return False
         return True
@@ -494,6 +490,17 @@ class TestStreamBulkSplit:
             out_duration = stats.endtime - stats.starttime
             assert abs(out_duration - 15) <= stats.sampling_rate * 2
 
+    def test_wildcard_bulk(self):
+        """Ensure unix style matching still works in bulk requests."""
+        st = obspy.read()
+        t1, t2 = st[0].stats.starttime + 1, st[0].stats.endtime - 1
+        bulk = [("BW", "RJOB", "", "EH*", t1, t2), ("BW", "RJOB", "", "EHZ", t1, t2)]
+        out = stream_bulk_split(st, bulk)
+        assert len(out) == 2
+        assert len(out[0]) == len(st)
+        assert len(out[1]) == 1
+        assert out[1][0].id == "BW.RJOB..EHZ"
+
     def test_input_from_df(self, bing_pick_bulk, bingham_stream, bingham_dataset):
         """Ensure bulk can be formed from a dataframe."""
         st_client = bingham_dataset.waveform_client
@@ -540,15 +547,20 @@ class TestGetWaveformBulk:
         assert isinstance(out, pd.DataFrame)
         assert len(out) == len(self.bulk1)
 
+    def test_generator(self):
+        """A generator of requests should work the same as a list."""
+        out = get_waveform_bulk_df(x for x in self.bulk1)
+        assert out.equals(get_waveform_bulk_df(self.bulk1))
+
     def test_dict(self):
         """Ensure a list of dicts also works."""
         bulk_dict = []
         for bulk in self.bulk1:
             req_dict = {i: v for i, v in zip(WAVEFORM_REQUEST_DTYPES, bulk)}
             bulk_dict.append(req_dict)
-        df = pd.DataFrame(bulk_dict)
+        df = get_waveform_bulk_df(bulk_dict)
         assert isinstance(df, pd.DataFrame)
-        assert len(df) == len(self.bulk1)
+        assert df.equals(get_waveform_bulk_df(self.bulk1))
 
     def test_dataframe(self, bulk_df):
         """Ensure a datframe with no extra columns works."""